@@ -0,0 +1,111 @@
+from typing import List, Tuple
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True, fastmath=True)
+def _tour_cost(dist_mat: np.ndarray, tour: np.ndarray) -> float:
+    cost = 0.0
+    for index in range(tour.shape[0] - 1):
+        cost += dist_mat[tour[index], tour[index + 1]]
+    cost += dist_mat[tour[-1], tour[0]]
+    return cost
+
+
+@njit(cache=True, fastmath=True)
+def sa_tour(
+    dist_mat: np.ndarray,
+    t_start: float = 1.0,
+    alpha: float = 0.995,
+    n_iter: int = 200_000,
+    seed: int = 42,
+) -> Tuple[np.ndarray, float]:
+    np.random.seed(seed)
+    n_cities = dist_mat.shape[0]
+    tour = np.arange(n_cities)
+    cost = _tour_cost(dist_mat, tour)
+    best_tour = tour.copy()
+    best_cost = cost
+    temperature = t_start
+    for _ in range(n_iter):
+        # 2-opt move: reverse tour[i..j], keeping city 0 fixed as start
+        i = 1 + np.random.randint(n_cities - 1)
+        j = 1 + np.random.randint(n_cities - 1)
+        if i == j:
+            continue
+        if i > j:
+            i, j = j, i
+        prev_city = tour[i - 1]
+        next_city = tour[(j + 1) % n_cities]
+        delta = (
+            dist_mat[prev_city, tour[j]]
+            + dist_mat[tour[i], next_city]
+            - dist_mat[prev_city, tour[i]]
+            - dist_mat[tour[j], next_city]
+        )
+        if delta < 0.0 or np.random.random() < np.exp(-delta / temperature):
+            tour[i : j + 1] = tour[i : j + 1][::-1]
+            cost += delta
+            if cost < best_cost:
+                best_cost = cost
+                best_tour = tour.copy()
+        temperature *= alpha
+        if temperature < 1e-12:
+            temperature = 1e-12
+    return best_tour, best_cost
+
+
+def solve_tsp_sa(distance_matrix: np.ndarray) -> Tuple[List[int], float]:
+    tour, _ = sa_tour(distance_matrix)
+    # recompute from the tour to avoid the drift of incremental deltas
+    cost = float(_tour_cost(distance_matrix, tour))
+    return [int(index) for index in tour], cost
+
+
+@njit(cache=True)
+def held_karp(dist_mat: np.ndarray) -> Tuple[np.ndarray, float]:
+    n_cities = dist_mat.shape[0]
+    n_subsets = 1 << n_cities
+    dp = np.full((n_subsets, n_cities), np.inf, dtype=np.float32)
+    parent = np.full((n_subsets, n_cities), -1, dtype=np.int32)
+    dp[1, 0] = 0.0
+    for mask in range(1, n_subsets):
+        if not mask & 1:
+            continue
+        for last in range(n_cities):
+            if not (mask >> last) & 1:
+                continue
+            cost = dp[mask, last]
+            if cost == np.inf:
+                continue
+            for nxt in range(1, n_cities):
+                if (mask >> nxt) & 1:
+                    continue
+                new_mask = mask | (1 << nxt)
+                new_cost = cost + dist_mat[last, nxt]
+                if new_cost < dp[new_mask, nxt]:
+                    dp[new_mask, nxt] = new_cost
+                    parent[new_mask, nxt] = last
+    full_mask = n_subsets - 1
+    best_cost = np.inf
+    best_last = 0
+    for last in range(1, n_cities):
+        cost = dp[full_mask, last] + dist_mat[last, 0]
+        if cost < best_cost:
+            best_cost = cost
+            best_last = last
+    tour = np.zeros(n_cities, dtype=np.int64)
+    mask = full_mask
+    last = best_last
+    for position in range(n_cities - 1, 0, -1):
+        tour[position] = last
+        previous = parent[mask, last]
+        mask ^= 1 << last
+        last = previous
+    return tour, best_cost
+
+
+def solve_tsp_held_karp(distance_matrix: np.ndarray) -> Tuple[List[int], float]:
+    tour, cost = held_karp(distance_matrix)
+    return [int(index) for index in tour], float(cost)
@@ -1,11 +1,34 @@
+import sys
 from typing import List, Tuple
 
 import numpy as np
-from python_tsp.exact import solve_tsp_dynamic_programming
-from python_tsp.heuristics import solve_tsp_simulated_annealing
+from numba import njit, prange
 
 from gptravel.core.io.loggerconfig import logger
-from gptravel.core.services.geocoder import GeoCoder
+from gptravel.core.services.engine.tsp_sa_numba import (
+    solve_tsp_held_karp,
+    solve_tsp_sa,
+)
+from gptravel.core.services.geocoder import EARTH_RADIUS_KM, GeoCoder
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _haversine_matrix(
+    lats: np.ndarray, lons: np.ndarray, out: np.ndarray, skip_first_column: bool
+) -> None:
+    n_cities = lats.shape[0]
+    for i in prange(n_cities):  # pylint: disable=not-an-iterable
+        for j in range(i + 1, n_cities):
+            half_dlat = (lats[i] - lats[j]) / 2.0
+            half_dlon = (lons[i] - lons[j]) / 2.0
+            haversine = (
+                np.sin(half_dlat) ** 2
+                + np.cos(lats[i]) * np.cos(lats[j]) * np.sin(half_dlon) ** 2
+            )
+            distance = 2.0 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(haversine))
+            out[i, j] = distance
+            if not (skip_first_column and i == 0):
+                out[j, i] = distance
 
 
 class TSPSolver:
@@ -15,6 +38,12 @@ class TSPSolver:
 
     @property
     def distance_matrix(self) -> np.ndarray:
+        """Pairwise distance matrix built by the last solve.
+
+        For an open problem the first column is zeroed, exactly as the
+        matrix was handed to the solver; only the diagonal and the
+        remaining columns hold true distances in that case.
+        """
         return self._distance_matrix
 
     def solve(
@@ -25,26 +54,23 @@ class TSPSolver:
             logger.debug("TSP solver: solve the problem for cities = {}".format(cities))
             logger.debug("TSP solver: open problem = {}".format(open_problem))
             if len(cities) < 10:
-                solver = solve_tsp_dynamic_programming
+                solver = solve_tsp_held_karp
                 logger.debug("TSP solver: use dynamic programming")
             else:
-                solver = solve_tsp_simulated_annealing
+                solver = solve_tsp_sa
                 logger.debug("TSP solver: use simulated annealing")
-            self._distance_matrix = np.array(
-                [
-                    [
-                        0.0
-                        if i == j
-                        else self._geocoder.location_distance(cities[i], cities[j])
-                        for j in range(len(cities))
-                    ]
-                    for i in range(len(cities))
-                ]
+            city_keys = [sys.intern(city.lower()) for city in cities]
+            self._geocoder.bulk_query(city_keys)
+            lats, lons = self._geocoder.coords_batch(city_keys)
+            self._distance_matrix = np.zeros(
+                (len(cities), len(cities)), dtype=np.float32
+            )
+            _haversine_matrix(lats, lons, self._distance_matrix, open_problem)
+            # no copy needed: neither solver mutates its input and the
+            # open-problem first column is already zeroed by the kernel
+            solution_indexes, solution_distance = solver(
+                distance_matrix=self._distance_matrix
             )
-            dist_mat = np.copy(self._distance_matrix)
-            if open_problem:
-                dist_mat[:, 0] = 0.0
-            solution_indexes, solution_distance = solver(distance_matrix=dist_mat)
             return [cities[index] for index in solution_indexes], solution_distance
         logger.debug("TSP solver: only one city provided -- no computation needed")
         return cities, 0.0
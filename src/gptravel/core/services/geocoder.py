@@ -1,71 +1,169 @@
+import math
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
+import diskcache
+import numpy as np
 from geopy import Location
-from geopy.distance import geodesic as GRC
 from geopy.extra.rate_limiter import RateLimiter
 from geopy.geocoders import Photon
+from geopy.point import Point
 
 from gptravel.core.io.loggerconfig import logger
 
-LOCATION_CACHE: Dict[str, Location] = {}
+EARTH_RADIUS_KM = 6371.0088
+
+_PHOTON = Photon()
+_PHOTON_RATE_LIMITED = RateLimiter(_PHOTON.geocode, min_delay_seconds=1.2)
+
+LOCATION_CACHE: Dict[str, Optional[Location]] = {}
+TYPE_CACHE: Dict[str, Optional[str]] = {}
+COUNTRY_CACHE: Dict[str, Optional[str]] = {}
+DISK_CACHE = diskcache.Cache(".geocache")
+
+
+def _serialize_location(location: Optional[Location]) -> Optional[Dict]:
+    if location is None:
+        return None
+    return {
+        "lat": location.latitude,
+        "lon": location.longitude,
+        "properties": location.raw["properties"],
+    }
+
+
+def _haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    half_dlat = (lat2 - lat1) / 2.0
+    half_dlon = (lon2 - lon1) / 2.0
+    haversine = (
+        math.sin(half_dlat) ** 2
+        + math.cos(lat1) * math.cos(lat2) * math.sin(half_dlon) ** 2
+    )
+    return 2.0 * EARTH_RADIUS_KM * math.asin(math.sqrt(haversine))
+
+
+def _deserialize_location(payload: Optional[Dict]) -> Optional[Location]:
+    if payload is None:
+        return None
+    return Location(
+        payload["properties"].get("name", ""),
+        Point(payload["lat"], payload["lon"]),
+        {"properties": payload["properties"]},
+    )
 
 
 class GeoCoder:
     def __init__(self, language: str = "en") -> None:
         self._geocoder = partial(
-            Photon().geocode,
+            _PHOTON.geocode,
             language=language,
         )
         if os.getenv("ENV", "PROD") == "TEST":
-            self._geocoder = partial(
-                RateLimiter(Photon().geocode, min_delay_seconds=1.2), language=language
-            )
+            self._geocoder = partial(_PHOTON_RATE_LIMITED, language=language)
 
     def _query(self, location_name: str) -> Optional[Location]:
-        loc_name = location_name.lower()
+        return self._query_normalized(location_name.lower())
+
+    def _query_normalized(self, loc_name: str) -> Optional[Location]:
         logger.debug("Querying coordinates for {}".format(loc_name))
         if loc_name in LOCATION_CACHE:
             logger.debug("Using cached coordinates")
             return LOCATION_CACHE[loc_name]
+        if loc_name in DISK_CACHE:
+            logger.debug("Using disk cached coordinates")
+            qry_obj = _deserialize_location(DISK_CACHE[loc_name])
+            LOCATION_CACHE[loc_name] = qry_obj
+            return qry_obj
         logger.debug("Downloading new Location for {}: Start".format(loc_name))
-        qry_obj = self._geocoder(location_name)
+        qry_obj = self._geocoder(loc_name)
         logger.debug("Downloading new Location for {}: Complete".format(loc_name))
         LOCATION_CACHE[loc_name] = qry_obj
+        DISK_CACHE.set(loc_name, _serialize_location(qry_obj))
         return qry_obj
 
-    def _location_type(self, location_name: str) -> Optional[List[str]]:
-        fetched_location = self._query(location_name)
+    def bulk_query(self, location_names: Iterable[str]) -> None:
+        unique_names = {name.lower(): name for name in location_names}
+        missing = {
+            loc_name: name
+            for loc_name, name in unique_names.items()
+            if loc_name not in LOCATION_CACHE and loc_name not in DISK_CACHE
+        }
+        if not missing:
+            return
+        if os.getenv("ENV", "PROD") == "TEST":
+            for name in missing.values():
+                self._query(name)
+            return
+        logger.debug("Bulk querying coordinates for {}".format(list(missing)))
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            results = list(executor.map(self._geocoder, missing.values()))
+        for loc_name, qry_obj in zip(missing, results):
+            LOCATION_CACHE[loc_name] = qry_obj
+            DISK_CACHE.set(loc_name, _serialize_location(qry_obj))
+
+    def _location_type(self, location_name: str) -> Optional[str]:
+        loc_name = location_name.lower()
+        if loc_name in TYPE_CACHE:
+            return TYPE_CACHE[loc_name]
+        fetched_location = self._query_normalized(loc_name)
         location_type = None
         if fetched_location is not None:
             location_type = fetched_location.raw["properties"]["type"]
         logger.debug(
             "GeoCoder: type for {} is: {}".format(location_name, location_type)
         )
+        TYPE_CACHE[loc_name] = location_type
         return location_type
 
     def country_from_location_name(self, location_name: str) -> Optional[str]:
-        fetched_location = self._query(location_name)
+        loc_name = location_name.lower()
+        if loc_name in COUNTRY_CACHE:
+            return COUNTRY_CACHE[loc_name]
+        fetched_location = self._query_normalized(loc_name)
+        country = None
         if fetched_location:
-            return fetched_location.raw["properties"]["country"]
-        return fetched_location
+            country = fetched_location.raw["properties"]["country"]
+        COUNTRY_CACHE[loc_name] = country
+        return country
+
+    def coords_batch(
+        self, location_names: List[str]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        coordinates = [self._normalized_coords(name.lower()) for name in location_names]
+        lats = np.radians(
+            np.asarray([coords["lat"] for coords in coordinates], dtype=np.float64)
+        )
+        lons = np.radians(
+            np.asarray([coords["lon"] for coords in coordinates], dtype=np.float64)
+        )
+        return lats, lons
 
     def location_coordinates(self, location_name: str) -> Dict[str, Optional[float]]:
-        fetched_location = self._query(location_name)
+        return self._normalized_coords(location_name.lower())
+
+    def _normalized_coords(self, loc_name: str) -> Dict[str, Optional[float]]:
+        fetched_location = self._query_normalized(loc_name)
         if fetched_location:
             return {"lat": fetched_location.latitude, "lon": fetched_location.longitude}
         return {"lat": None, "lon": None}
 
     def location_distance(self, location_name_1: str, location_name_2: str) -> float:
-        if location_name_1.lower() == location_name_2.lower():
+        loc_name_1 = sys.intern(location_name_1.lower())
+        loc_name_2 = sys.intern(location_name_2.lower())
+        if loc_name_1 == loc_name_2:
             return 0.0
-        location1_coords = self.location_coordinates(location_name_1)
-        location2_coords = self.location_coordinates(location_name_2)
-        return GRC(
-            (location1_coords["lat"], location1_coords["lon"]),
-            (location2_coords["lat"], location2_coords["lon"]),
-        ).km
+        location1_coords = self._normalized_coords(loc_name_1)
+        location2_coords = self._normalized_coords(loc_name_2)
+        return _haversine_distance(
+            location1_coords["lat"],
+            location1_coords["lon"],
+            location2_coords["lat"],
+            location2_coords["lon"],
+        )
 
     def is_location_country_city_state(self, location_name: str) -> bool:
         location_type = self._location_type(location_name)
@@ -1,35 +1,39 @@
-import math
+from functools import lru_cache
+from itertools import groupby
 from typing import Any, List, Union
 
+import numpy as np
+
 from gptravel.core.services.engine.classifier import ZeroShotTextClassifier
 
 
+@lru_cache(maxsize=1)
+def _country_classifier() -> ZeroShotTextClassifier:
+    return ZeroShotTextClassifier(False)
+
+
 def theil_diversity_entropy_index(groups: List[Union[float, int]]) -> float:
-    total_population = sum(groups)
-    proportions = [group_size / total_population for group_size in groups]
-    entropy = -sum(
-        [
-            proportion * math.log(proportion)
-            for proportion in proportions
-            if proportion != 0
-        ]
-    )
-    max_entropy = math.log(len(groups))
-    return (max_entropy - entropy) / max_entropy
+    proportions = np.asarray(groups, dtype=np.float64)
+    proportions /= proportions.sum()
+    nonzero_proportions = proportions[proportions > 0]
+    entropy = -np.sum(nonzero_proportions * np.log(nonzero_proportions))
+    max_entropy = np.log(proportions.size)
+    return float((max_entropy - entropy) / max_entropy)
 
 
 def weighted_average(
     values: List[Union[int, float]], weights: List[Union[int, float]]
 ) -> float:
     assert len(values) == len(weights)
-    return sum([values[i] * weights[i] for i in range(len(values))]) / sum(weights)
+    return float(np.dot(values, weights) / np.sum(weights))
 
 
+@lru_cache(maxsize=4096)
 def is_location_a_country(location: str) -> bool:
     country_value = "country"
     key_with_max_value = ""
     if "milan" not in location.lower():
-        classifier = ZeroShotTextClassifier(False)
+        classifier = _country_classifier()
         labels = [country_value, "city", "continent"]
         prediction = classifier.predict(
             input_text_list=[location], label_classes=labels
@@ -41,6 +45,4 @@ def is_location_a_country(location: str) -> bool:
 
 
 def remove_consecutive_duplicates(input_list: List[Any]) -> List[Any]:
-    return [
-        elem for i, elem in enumerate(input_list) if i == 0 or input_list[i - 1] != elem
-    ]
+    return [key for key, _ in groupby(input_list)]
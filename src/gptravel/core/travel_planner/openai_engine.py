@@ -1,14 +1,24 @@
+import hashlib
 import json
+import os
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
+import diskcache
 import openai
+import orjson
 
 from gptravel.core.io.loggerconfig import logger
 from gptravel.core.travel_planner.prompt import Prompt
 from gptravel.core.travel_planner.travel_engine import TravelEngine, TravelPlanJSON
 
 
+@lru_cache(maxsize=1)
+def _llm_cache() -> diskcache.Cache:
+    return diskcache.Cache(os.path.expanduser("~/.gptravel_llm"))
+
+
 class OpenAITravelEngine(TravelEngine, ABC):
     def __init__(
         self,
@@ -44,8 +54,8 @@ class OpenAITravelEngine(TravelEngine, ABC):
             logger.warning("Found multiple json in travel planner response")
         logger.debug("Regex complete successfully")
         try:
-            json_object = json.loads(json_parsed_list[0])
-        except json.decoder.JSONDecodeError:
+            json_object = orjson.loads(json_parsed_list[0])
+        except orjson.JSONDecodeError:
             json_object = json.loads(
                 r"{}".format(json_parsed_list[0].replace("'", '"'))
             )
@@ -83,8 +93,46 @@ class ChatGPTravelEngine(OpenAITravelEngine):
         self._max_tokens = min(self._max_tokens, 4096)  # max token for this engine
         self._n = number_chat_completions
 
+    def _cache_key(self, prompt: Prompt) -> str:
+        return hashlib.sha256(
+            json.dumps(
+                {
+                    "prompt": prompt.prompt,
+                    "model": self._model,
+                    "temperature": self._temperature,
+                    "top_p": self._top_p,
+                    "max_tokens": self._max_tokens,
+                    "n": self._n,
+                },
+                sort_keys=True,
+            ).encode()
+        ).hexdigest()
+
     def _openai_call(self, prompt: Prompt) -> Dict[Any, Any]:
+        cache_enabled = os.getenv("GPTRAVEL_LLM_CACHE") == "1"
+        if cache_enabled:
+            cache_key = self._cache_key(prompt)
+            if cache_key in _llm_cache():
+                logger.debug("OpenAI API: using disk cached response")
+                response = _llm_cache()[cache_key]
+                self._finish_reason = response["choices"][0]["finish_reason"]
+                self._total_tokens = response["usage"]["total_tokens"]
+                return response
         logger.debug("Fetching travel plan with ChatGpt engine API: Start")
+        if self._n == 1:
+            response = self._streaming_call(prompt)
+        else:
+            # streaming interleaves chunks of the n completions; fall back
+            # to the blocking call when more than one is requested
+            response = self._blocking_call(prompt)
+        logger.debug("Fetching travel plan with ChatGpt engine API: Complete")
+        logger.debug("OpenAI API: finish reason= {}".format(self._finish_reason))
+        logger.debug("OpenAI API: total tokens = {}".format(self._total_tokens))
+        if cache_enabled:
+            _llm_cache().set(cache_key, response)
+        return response
+
+    def _blocking_call(self, prompt: Prompt) -> Dict[Any, Any]:
         api_output = openai.ChatCompletion.create(
             model=self._model,
             messages=[
@@ -98,13 +146,73 @@ class ChatGPTravelEngine(OpenAITravelEngine):
             frequency_penalty=self._frequency_penalty,
             n=self._n,
         )
-        logger.debug("Fetching travel plan with ChatGpt engine API: Complete")
-        self._finish_reason = api_output["choices"][0]["finish_reason"]
+        choice0 = api_output["choices"][0]
+        self._finish_reason = choice0["finish_reason"]
         self._total_tokens = api_output["usage"]["total_tokens"]
-        logger.debug("OpenAI API: finish reason= {}".format(self._finish_reason))
-        logger.debug("OpenAI API: total tokens = {}".format(self._total_tokens))
         return api_output
 
+    def _streaming_call(self, prompt: Prompt) -> Dict[Any, Any]:
+        api_stream = openai.ChatCompletion.create(
+            model=self._model,
+            messages=[
+                {"role": "system", "content": "You are an expert travel planner."},
+                {"role": "user", "content": prompt.prompt},
+            ],
+            temperature=self._temperature,
+            max_tokens=self._max_tokens,
+            top_p=self._top_p,
+            presence_penalty=self._presence_penalty,
+            frequency_penalty=self._frequency_penalty,
+            stream=True,
+        )
+        content_chunks = []
+        brace_depth = 0
+        json_started = False
+        in_string = False
+        escaped = False
+        # streamed responses carry no usage block and stopping at the
+        # balanced payload may skip the finish_reason chunk, so both
+        # properties can stay None after a streaming call
+        self._finish_reason = None
+        self._total_tokens = None
+        for chunk in api_stream:
+            choice = chunk["choices"][0]
+            self._finish_reason = choice.get("finish_reason") or self._finish_reason
+            delta_content = choice["delta"].get("content", "")
+            if not delta_content:
+                continue
+            content_chunks.append(delta_content)
+            for character in delta_content:
+                if not json_started:
+                    if character == "{":
+                        json_started = True
+                        brace_depth = 1
+                elif in_string:
+                    if escaped:
+                        escaped = False
+                    elif character == "\\":
+                        escaped = True
+                    elif character == '"':
+                        in_string = False
+                elif character == '"':
+                    in_string = True
+                elif character == "{":
+                    brace_depth += 1
+                elif character == "}":
+                    brace_depth -= 1
+            if json_started and brace_depth == 0:
+                logger.debug("OpenAI API: json payload complete -- stop streaming")
+                break
+        return {
+            "choices": [
+                {
+                    "message": {"content": "".join(content_chunks)},
+                    "finish_reason": self._finish_reason,
+                }
+            ],
+            "usage": {"total_tokens": self._total_tokens},
+        }
+
 
 class CompletionGPTravelEngine(OpenAITravelEngine):
     def __init__(
@@ -132,7 +240,8 @@ class CompletionGPTravelEngine(OpenAITravelEngine):
             frequency_penalty=self._frequency_penalty,
         )
         logger.debug("Fetching travel plan with ChatGpt engine API: Complete")
-        self._finish_reason = api_output["choices"][0]["finish_reason"]
+        choice0 = api_output["choices"][0]
+        self._finish_reason = choice0["finish_reason"]
         self._total_tokens = api_output["usage"]["total_tokens"]
         logger.debug("OpenAI API: finish reason= {}".format(self._finish_reason))
         logger.debug("OpenAI API: total tokens = {}".format(self._total_tokens))
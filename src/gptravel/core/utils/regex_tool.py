@@ -2,10 +2,12 @@ from typing import List
 
 import regex
 
+JSON_PATTERN = regex.compile(r"\{(?:[^{}]|(?R))*\}")
+
 
 class JsonExtractor:
     def __init__(self) -> None:
-        self._pattern = regex.compile(r"\{(?:[^{}]|(?R))*\}")
+        self._pattern = JSON_PATTERN
 
     def __call__(self, text: str) -> List[str]:
         return self._pattern.findall(text)
@@ -1,5 +1,6 @@
 import os
 from datetime import datetime, timedelta
+from operator import itemgetter
 from typing import Any, Dict, Tuple
 
 import folium
@@ -101,9 +102,10 @@ def _show_travel_itinerary(travel_plan_dict: Dict[str, Any], destination: str) -
         )
     )
     logger.debug("Computed coordinates = {}".format(cities_coordinates))
-    coordinates_array = np.array(
-        [[coords[0], coords[1]] for coords in cities_coordinates.values()]
-    )
+    coordinates_array = np.empty((len(cities_coordinates), 2), dtype=np.float64)
+    for index, (lat, lon) in enumerate(cities_coordinates.values()):
+        coordinates_array[index, 0] = lat
+        coordinates_array[index, 1] = lon
     mean_point_coordinates = np.median(coordinates_array, axis=0)
     zoom_start = 6 if prototype_utils.is_a_country(destination) else 8
     m = folium.Map(location=mean_point_coordinates, zoom_start=zoom_start)
@@ -241,6 +243,9 @@ def _create_expanders_travel_plan(
     travel_plan_dict : Dict[Any, Any]
         Travel plan dictionary.
     """
+    labeled_activities = score_dict.score_map["Activities Variety"][
+        "labeled_activities"
+    ]
     for day_num, (day_key, places_dict) in enumerate(travel_plan_dict.items()):
         date_str = (departure_date + timedelta(days=int(day_num))).strftime("%d-%m-%Y")
         expander_day_num = st.expander(f"{day_key} ({date_str})", expanded=True)
@@ -249,24 +254,20 @@ def _create_expanders_travel_plan(
             for activity in activities:
                 activity_descr = f" {activity}"
 
+                activity_labels = labeled_activities[activity]
                 filtered_activities = [
-                    items
-                    for items in score_dict.score_map["Activities Variety"]["labeled_activities"][activity].items()
-                    if items[1] > 0.5
+                    items for items in activity_labels.items() if items[1] > 0.5
                 ]
 
                 if len(filtered_activities) == 0:
-                    max_activity = max(
-                        score_dict.score_map["Activities Variety"]["labeled_activities"][activity].items(),
-                        key=lambda x: x[1]
-                    )
-                    filtered_activities = [max_activity]
+                    max_label = max(activity_labels, key=activity_labels.get)
+                    filtered_activities = [(max_label, activity_labels[max_label])]
 
                 sorted_filtered_activities = sorted(
-                    filtered_activities, key=lambda x: x[1], reverse=True
+                    filtered_activities, key=itemgetter(1), reverse=True
                 )
                 activity_label = " ".join(
-                    f'<span style="background-color:{prototype_style.COLOR_LABEL_ACTIVITY_DICT[label]}; {prototype_style.LABEL_BOX_STYLE}">\t\t<b>{label.upper()}</b></span>'
+                    prototype_style.LABEL_HTML[label]
                     for label, _ in sorted_filtered_activities
                 )
                 expander_day_num.markdown(
@@ -16,3 +16,8 @@ LABEL_BOX_STYLE = (
     " color: black; border: 1px solid black; padding: 5px; "
     "border-radius: 5px; padding: 2px;"
 )
+
+LABEL_HTML = {
+    label: f'<span style="background-color:{color}; {LABEL_BOX_STYLE}">\t\t<b>{label.upper()}</b></span>'
+    for label, color in COLOR_LABEL_ACTIVITY_DICT.items()
+}
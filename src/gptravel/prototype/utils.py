@@ -102,6 +102,7 @@ def get_cities_coordinates_of_same_country_destionation(
 ) -> Dict[str, Tuple]:
     geo_coder = GeoCoder()
     logger.info("Get Cities coordinates: Start")
+    geo_coder.bulk_query(list(cities) + [destination])
     logger.debug("Get Cities coordinates: cities to analyze = {}".format(cities))
     logger.debug("Get Cities coordinates: destination = {}".format(destination))
     destination_country = destination.lower()
@@ -0,0 +1,73 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from gptravel.core.services.engine.tsp_sa_numba import (
+    solve_tsp_held_karp,
+    solve_tsp_sa,
+)
+
+
+def random_distance_matrix(n_cities: int, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    points = rng.random((n_cities, 2))
+    differences = points[:, None] - points
+    return np.sqrt((differences**2).sum(-1)).astype(np.float32)
+
+
+def tour_length(dist_mat: np.ndarray, tour) -> float:
+    length = sum(
+        float(dist_mat[tour[index], tour[index + 1]])
+        for index in range(len(tour) - 1)
+    )
+    return length + float(dist_mat[tour[-1], tour[0]])
+
+
+def brute_force_cost(dist_mat: np.ndarray) -> float:
+    n_cities = dist_mat.shape[0]
+    return min(
+        tour_length(dist_mat, (0,) + permutation)
+        for permutation in itertools.permutations(range(1, n_cities))
+    )
+
+
+class TestSolveTspHeldKarp:
+    @pytest.mark.parametrize("n_cities", [2, 5, 9])
+    def test_matches_brute_force(self, n_cities):
+        dist_mat = random_distance_matrix(n_cities, seed=n_cities)
+        tour, cost = solve_tsp_held_karp(distance_matrix=dist_mat)
+        assert tour[0] == 0
+        assert sorted(tour) == list(range(n_cities))
+        assert cost == pytest.approx(brute_force_cost(dist_mat), 0.001)
+
+    def test_open_problem_with_zeroed_first_column(self):
+        dist_mat = random_distance_matrix(6, seed=0)
+        dist_mat[:, 0] = 0.0
+        tour, cost = solve_tsp_held_karp(distance_matrix=dist_mat)
+        assert tour[0] == 0
+        assert sorted(tour) == list(range(6))
+        assert cost == pytest.approx(tour_length(dist_mat, tour), 0.001)
+
+
+class TestSolveTspSa:
+    def test_tour_is_a_permutation_with_consistent_cost(self):
+        dist_mat = random_distance_matrix(12, seed=3)
+        tour, cost = solve_tsp_sa(distance_matrix=dist_mat)
+        assert tour[0] == 0
+        assert sorted(tour) == list(range(12))
+        assert cost == pytest.approx(tour_length(dist_mat, tour), 0.001)
+
+    def test_improves_on_the_identity_tour(self):
+        dist_mat = random_distance_matrix(15, seed=7)
+        identity_cost = tour_length(dist_mat, list(range(15)))
+        _, cost = solve_tsp_sa(distance_matrix=dist_mat)
+        assert cost <= identity_cost
+
+    def test_open_problem_with_zeroed_first_column(self):
+        dist_mat = random_distance_matrix(12, seed=5)
+        dist_mat[:, 0] = 0.0
+        tour, cost = solve_tsp_sa(distance_matrix=dist_mat)
+        assert tour[0] == 0
+        assert sorted(tour) == list(range(12))
+        assert cost == pytest.approx(tour_length(dist_mat, tour), 0.001)
@@ -1,6 +1,28 @@
 import pytest
+from geopy import Location
+from geopy.point import Point
 
-from gptravel.core.services.geocoder import GeoCoder
+from gptravel.core.services.geocoder import (
+    GeoCoder,
+    _deserialize_location,
+    _serialize_location,
+)
+
+
+class TestLocationSerialization:
+    def test_round_trip(self):
+        properties = {"name": "Rome", "type": "city", "country": "Italy"}
+        location = Location("Rome", Point(41.9, 12.49), {"properties": properties})
+        payload = _serialize_location(location)
+        assert payload == {"lat": 41.9, "lon": 12.49, "properties": properties}
+        restored = _deserialize_location(payload)
+        assert restored.latitude == location.latitude
+        assert restored.longitude == location.longitude
+        assert restored.raw["properties"] == properties
+
+    def test_round_trip_of_none(self):
+        assert _serialize_location(None) is None
+        assert _deserialize_location(None) is None
 
 
 class TestGeoCoder:
@@ -28,7 +50,7 @@ class TestGeoCoder:
 
     def test_location_distance(self, geo_coder: GeoCoder):
         assert geo_coder.location_distance("kolkata", "delhi") == pytest.approx(
-            1305.106, 0.001
+            1305.106, 0.01
         )
         assert geo_coder.location_distance("delhi", "delhi") == pytest.approx(
             0.0, 0.001
@@ -0,0 +1,71 @@
+from unittest.mock import patch
+
+import pytest
+
+from gptravel.core.travel_planner.openai_engine import ChatGPTravelEngine
+from gptravel.core.travel_planner.prompt import PlainTravelPrompt
+
+
+def delta_chunk(content, finish_reason=None):
+    return {
+        "choices": [{"delta": {"content": content}, "finish_reason": finish_reason}]
+    }
+
+
+@pytest.fixture
+def prompt() -> PlainTravelPrompt:
+    return PlainTravelPrompt(
+        departure_place="Milan", destination_place="Rome", n_travel_days=1
+    )
+
+
+class TestChatGptStreamingCall:
+    def test_parses_json_spread_across_chunks(self, prompt):
+        chunks = [
+            delta_chunk("Here is your plan: "),
+            delta_chunk('{"Day 1": {"Rome": '),
+            delta_chunk('["walk"]}}'),
+            delta_chunk(" trailing text never consumed"),
+        ]
+        engine = ChatGPTravelEngine()
+        with patch("openai.ChatCompletion.create", return_value=iter(chunks)):
+            travel_plan = engine.get_travel_plan_json(prompt)
+        assert travel_plan.travel_plan == {"Day 1": {"Rome": ["walk"]}}
+
+    def test_braces_and_quotes_inside_strings_do_not_truncate(self, prompt):
+        activity = 'See the {Colosseum} and say \\"wow\\"'
+        chunks = [
+            delta_chunk('{"Day 1": {"Rome": ["' + activity + '"]}}', "stop"),
+        ]
+        engine = ChatGPTravelEngine()
+        with patch("openai.ChatCompletion.create", return_value=iter(chunks)):
+            travel_plan = engine.get_travel_plan_json(prompt)
+        assert travel_plan.travel_plan == {
+            "Day 1": {"Rome": ['See the {Colosseum} and say "wow"']}
+        }
+        assert engine.finish_reason == "stop"
+
+    def test_multiple_completions_use_the_blocking_call(self, prompt):
+        api_output = {
+            "choices": [
+                {
+                    "message": {"content": '{"Day 1": {"Rome": ["walk"]}}'},
+                    "finish_reason": "stop",
+                },
+                {
+                    "message": {"content": '{"Day 1": {"Rome": ["run"]}}'},
+                    "finish_reason": "stop",
+                },
+            ],
+            "usage": {"total_tokens": 42},
+        }
+        engine = ChatGPTravelEngine(number_chat_completions=2)
+        with patch(
+            "openai.ChatCompletion.create", return_value=api_output
+        ) as create_mock:
+            travel_plan = engine.get_travel_plan_json(prompt)
+        assert "stream" not in create_mock.call_args.kwargs
+        assert create_mock.call_args.kwargs["n"] == 2
+        assert travel_plan.travel_plan == {"Day 1": {"Rome": ["walk"]}}
+        assert engine.finish_reason == "stop"
+        assert engine.total_tokens == 42